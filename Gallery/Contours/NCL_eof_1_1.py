@@ -56,25 +56,24 @@ neof = 3  # number of EOFs
 ###############################################################################
 # Read in data:
 
-# Open a netCDF data file using xarray default engine and load the data into xarrays
-ds = xr.open_dataset(gdf.get('netcdf_files/slp.mon.mean.nc'))
+# Open a netCDF data file using xarray default engine. Chunking along time keeps
+# the data as lazy dask arrays, so the preprocessing steps below are combined
+# into a single task graph that is only computed once, right before the EOFs.
+ds = xr.open_dataset(gdf.get('netcdf_files/slp.mon.mean.nc'),
+                     chunks={'time': 120})
 
 ###############################################################################
-# Flip and sort longitude coordinates:
+# Flip longitude coordinates and sort longitudes and latitudes:
 
 # To facilitate data subsetting
 
 ds["lon"] = ((ds["lon"] + 180) % 360) - 180
 
-# Sort longitudes, so that subset operations end up being simpler.
-ds = ds.sortby("lon")
-
-###############################################################################
-# Place latitudes in increasing order:
-
-# To facilitate data subsetting
-
-ds = ds.sortby("lat", ascending=True)
+# Sort longitudes, and place latitudes in increasing order, so that subset
+# operations end up being simpler. Both orderings are applied in a single
+# indexing step, so the data is only reordered once.
+ds = ds.isel(lon=np.argsort(ds["lon"].values, kind="stable"),
+             lat=np.argsort(ds["lat"].values, kind="stable"))
 
 ###############################################################################
 # Limit data to the specified years:
@@ -89,24 +88,27 @@ ds = ds.sel(time=slice(startDate, endDate))
 
 # Choose the winter season (December-January-February)
 season = "DJF"
+
+# When flox is installed, xarray automatically uses it for the grouped mean
+# inside month_to_season(), which reduces all seasons in one vectorized pass
+# instead of looping over groups in Python
 SLP = month_to_season(ds, season)
 
 ###############################################################################
 # Create weights: sqrt(cos(lat))   [or sqrt(gw) ]
-clat = SLP['lat'].astype(np.float64)
-clat = np.sqrt(np.cos(np.deg2rad(clat)))
+clat = np.sqrt(np.cos(np.deg2rad(SLP['lat'].astype(np.float64))))
 
 ###############################################################################
 # Multiply SLP by weights:
 
-# Xarray will apply latitude-based weights to all longitudes and timesteps automatically.
-# This is called "broadcasting".
+# The weights vary only along latitude, so they are broadcast against the
+# (time, lat, lon) values with NumPy directly. Multiplying the underlying
+# arrays skips xarray's coordinate alignment, and `copy(data=...)` keeps
+# the dims, coordinates, and attributes of slp.
 
 wSLP = SLP
-wSLP['slp'] = SLP['slp'] * clat
-
-# For now, metadata for slp must be copied over explicitly; it is not preserved by binary operators like multiplication.
-wSLP['slp'].attrs = ds['slp'].attrs
+slp = SLP['slp'].transpose('time', 'lat', 'lon')
+wSLP['slp'] = slp.copy(data=slp.data * clat.data[np.newaxis, :, np.newaxis])
 wSLP['slp'].attrs['long_name'] = 'Wgt: ' + wSLP['slp'].attrs['long_name']
 
 ###############################################################################
@@ -118,8 +120,9 @@ xw = wSLP.sel(lat=slice(latS, latN), lon=slice(lonL, lonR))
 # Compute the EOFs:
 
 # Transpose data to have 'time' in the first dimension
-# as `eofunc` functions expects so for xarray inputs for now
-xw_slp = xw["slp"].transpose('time', 'lat', 'lon')
+# as `eofunc` functions expects so for xarray inputs for now, and load
+# the lazily preprocessed data into memory
+xw_slp = xw["slp"].transpose('time', 'lat', 'lon').compute()
 
 eofs = eofunc_eofs(xw_slp, neofs=neof, meta=True)
 
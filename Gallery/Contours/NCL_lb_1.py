@@ -55,7 +55,7 @@ a = wrap_v.plot.contourf(levels=np.arange(-24, 32, 4),
 # Contour-plot data (for borderlines)
 wrap_v.plot.contour(levels=np.arange(-24, 32, 4),
                     linewidths=0.5,
-                    cmap='black',
+                    colors='black',
                     add_labels=False)
 
 # Add vertical colorbar
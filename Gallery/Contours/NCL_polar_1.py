@@ -99,7 +99,7 @@ p = wrap_U.plot.contour(ax=ax,
                         transform=ccrs.PlateCarree(),
                         levels=np.arange(-12, 44, 4),
                         linewidths=0.5,
-                        cmap='black',
+                        colors='black',
                         add_labels=False)
 
 ax.clabel(p, np.arange(-8, 17, 8), fmt='%d', inline=1, fontsize=14)
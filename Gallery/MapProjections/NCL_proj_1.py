@@ -75,7 +75,7 @@ wrap_t.plot.contour(ax=ax,
                     transform=ccrs.PlateCarree(),
                     levels=11,
                     linewidths=0.5,
-                    cmap='black')
+                    colors='black')
 
 # Use geocat.viz.util convenience function to add titles to left and right of the plot axis.
 gv.set_titles_and_labels(ax,
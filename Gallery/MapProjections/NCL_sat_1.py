@@ -71,7 +71,7 @@ p = wrap_pressure.plot.contour(ax=ax,
                                transform=ccrs.PlateCarree(),
                                linewidths=0.5,
                                levels=contours,
-                               cmap='black',
+                               colors='black',
                                add_labels=False)
 
 # regular pressure contour levels- These values were found by setting
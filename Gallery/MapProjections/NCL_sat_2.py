@@ -84,7 +84,7 @@ p = wrap_pressure.plot.contour(ax=ax,
                                transform=ccrs.PlateCarree(),
                                linewidths=0.3,
                                levels=30,
-                               cmap='black',
+                               colors='black',
                                add_labels=False)
 
 # low pressure contour levels- these will be plotted
@@ -49,7 +49,7 @@ U = U[::4, ::4]
 V = V[::4, ::4]
 
 # Calculate the magnitude of the winds
-magnitude = np.sqrt(U.data**2 + V.data**2)
+magnitude = np.hypot(U.data, V.data)
 
 ###############################################################################
 # Plot:
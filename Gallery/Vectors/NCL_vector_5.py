@@ -22,7 +22,7 @@ See following URLs to see the reproduced NCL plot & script:
 import numpy as np
 import xarray as xr
 from matplotlib import pyplot as plt
-from scipy.interpolate import interp2d
+from scipy.interpolate import RegularGridInterpolator
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 import metpy.calc as mpcalc
 from metpy.units import units
@@ -37,6 +37,10 @@ import warnings
 # Read in data:
 ds = xr.open_dataset(gdf.get("netcdf_files/atmos.nc"), decode_times=False)
 
+# Only the first timestep along the 170E meridian is plotted, so select it
+# before interpolating to avoid reading and interpolating the rest of the data
+ds = ds.isel(time=0).sel(lon=170, method="nearest")
+
 # Define an array of surface pressures
 pnew = np.arange(200, 901, 50)
 
@@ -51,44 +55,34 @@ PS = PS / 100  # Convert from Pascal to mb
 warnings.filterwarnings("ignore")
 
 # Read in variables from data interpolated to pressure levels
-# interp_hybrid_to_pressure is the Python version of vinth2p in NCL script
-T = interp_hybrid_to_pressure(data=ds.T,
-                              ps=PS,
-                              hyam=hyam,
-                              hybm=hybm,
-                              p0=P0mb,
-                              new_levels=pnew,
-                              method='log')
-W = interp_hybrid_to_pressure(data=ds.OMEGA,
-                              ps=PS,
-                              hyam=hyam,
-                              hybm=hybm,
-                              p0=P0mb,
-                              new_levels=pnew,
-                              method='log')
-V = interp_hybrid_to_pressure(data=ds.V,
-                              ps=PS,
-                              hyam=hyam,
-                              hybm=hybm,
-                              p0=P0mb,
-                              new_levels=pnew,
-                              method='log')
+# interp_hybrid_to_pressure is the Python version of vinth2p in NCL script.
+# T, OMEGA, and V share the same hybrid coefficients and surface pressure, so
+# stack them along a new "variable" dimension and interpolate them in one call.
+# The surface pressure needs the same dimension to match the stacked data.
+data = ds[['T', 'OMEGA', 'V']].to_array('variable')
+interp = interp_hybrid_to_pressure(
+    data=data,
+    ps=PS.expand_dims(variable=data['variable'].values),
+    hyam=hyam,
+    hybm=hybm,
+    p0=P0mb,
+    new_levels=pnew,
+    method='log')
 
 # Extract data
-T = T.isel(time=0).sel(lon=170, method="nearest")
-W = W.isel(time=0).sel(lon=170, method="nearest")
-V = V.isel(time=0).sel(lon=170, method="nearest")
+T = interp.sel(variable='T')
+W = interp.sel(variable='OMEGA')
+V = interp.sel(variable='V')
 
 # Scale W
-wscaler = np.mean(W)
-vscaler = np.mean(V)
-scale = abs(vscaler / wscaler)
+# Levels below the surface are NaN after interpolation, so use nanmean
+scale = abs(np.nanmean(V.values) / np.nanmean(W.values))
 
 # We need to flip the sign of wscale to make sure that the vertical component
 # of the streamplot is correct. We are currently unsure why this is needed yet since this
 # is not in the original NCL script. We will continue to research into implementing
 # curly vectors in Matplotlib
-wscale = W * scale * -1
+wscale = W.values * scale * -1
 
 ###############################################################################
 # Plot:
@@ -102,14 +96,6 @@ ax = plt.axes()
 # Specify which contours should be drawn
 levels = np.linspace(200, 300, 11)
 
-# # Plot contour lines
-T.plot.contour(ax=ax,
-               levels=levels,
-               colors='black',
-               linewidths=0.5,
-               linestyles='solid',
-               add_labels=False)
-
 # # Plot filled contours
 colors = T.plot.contourf(ax=ax,
                          levels=levels,
@@ -117,21 +103,26 @@ colors = T.plot.contourf(ax=ax,
                          add_labels=False,
                          add_colorbar=False)
 
+# # Plot contour lines, reusing the levels and contour generator of the filled contours
+ax.contour(colors, colors='black', linewidths=0.5, linestyles='solid')
+
 # We attempt to recreate curly vectors with Matplotlib's streamplot function.
 # streamplot requires the input parameter x, y to be evenly spaced strictly increasing arrays.
-# Therefore we interpolate the original dataset onto an manually set, evenly spaced grid.
-# There are probably more suitable interpolation routines than scipy's interp2d,
-# but we do not have a standardized procedure for interpolation for streamplot as of this point.
+# Therefore we linearly interpolate the original dataset onto a manually set, evenly spaced grid.
+# The data is already on a rectilinear (plev, lat) grid, so scipy's RegularGridInterpolator
+# can be used instead of fitting splines to it.
 
 # regularly spaced grid spanning the domain of x and y
 xi = np.linspace(T['lat'].min(), T['lat'].max(), T['lat'].size)
 yi = np.linspace(T['plev'].min(), T['plev'].max(), T['plev'].size)
 
-# interp2d function creates interpolator classes
-u_func = interp2d(T['lat'], T['plev'], V)
-v_func = interp2d(T['lat'], T['plev'], wscale)
-uCi = u_func(xi, yi)
-vCi = v_func(xi, yi)
+# Interpolate both components at once, so the grid cell lookup is shared
+YI, XI = np.meshgrid(yi, xi, indexing='ij')
+uv = np.stack([V.values, wscale], axis=-1)
+uvCi = RegularGridInterpolator((T['plev'].values, T['lat'].values),
+                               uv)((YI, XI))
+uCi = uvCi[..., 0]
+vCi = uvCi[..., 1]
 
 # Use streamplot to match curly vector
 ax.streamplot(xi,
@@ -155,8 +146,10 @@ ax.add_patch(
                   clip_on=False))
 
 # Add quiverkey
-# Draw translucent vector plot to be set as input for quiverkey
-Q = ax.quiver(T['lat'], T['plev'], V, wscale, alpha=0, scale=400)
+# Draw a single translucent vector to be set as input for quiverkey. The width
+# is matplotlib's default arrow width for the full grid of vectors, so the key
+# looks the same as it would for a quiver plot of all the data.
+Q = ax.quiver([0], [500], [30], [0], alpha=0, scale=400, width=0.0024)
 ax.quiverkey(Q,
              0.828,
              0.120,
@@ -200,9 +193,9 @@ gv.set_titles_and_labels(ax,
 # Create second y-axis to show geo-potential height.
 axRHS = gv.add_height_from_pressure_axis(ax, heights=[4, 8, 12])
 
-# Force the plot to be square by setting the aspect ratio to 1
+# Force the plot to be square by setting the aspect ratio to 1. This also
+# applies to axRHS, since set_box_aspect propagates to twinned axes
 ax.set_box_aspect(1)
-axRHS.set_box_aspect(1)
 
 # Set tick lengths
 ax.tick_params('both', which='major', length=12, pad=9)